@@ -24,6 +24,14 @@ class ConstraintGenerator:
         self.build_example = build_example
         self.solver = self._create_persistent_solver()
         
+        # Models whose difference constraints have already been handed out,
+        # keyed by id and kept alive so that ids are never reused
+        self.excluded_models = {}
+        
+        # The is_world term of each state, built on first use and shared by
+        # the difference and non-isomorphic constraints of every model
+        self._world_terms = None
+        
         # Preserve original constraints for iteration
         original_constraints = []
         if hasattr(build_example, 'model_constraints') and \
@@ -52,7 +60,12 @@ class ConstraintGenerator:
         return persistent_solver
     
     def create_extended_constraints(self, previous_models):
-        """Create constraints that exclude all previous models.
+        """Create constraints that exclude previous models not yet excluded.
+        
+        Constraints passed to check_satisfiability stay on the persistent
+        solver, so each model only needs its difference constraint once.
+        Models handled by an earlier call are skipped rather than re-added on
+        every search attempt.
         
         Args:
             previous_models: List of Z3 models to exclude
@@ -62,8 +75,11 @@ class ConstraintGenerator:
         """
         extended_constraints = []
         
-        # Add difference constraints for each previous model
+        # Add difference constraints for each previous model not yet excluded
         for model in previous_models:
+            if id(model) in self.excluded_models:
+                continue
+            self.excluded_models[id(model)] = model
             difference_constraint = self._create_difference_constraint([model])
             if difference_constraint is not None:
                 extended_constraints.append(difference_constraint)
@@ -164,36 +180,19 @@ class ConstraintGenerator:
         constraints = []
         
         try:
-            # Get semantics from the build example
-            semantics = self.build_example.model_constraints.semantics
-            N = self.build_example.settings.get('N', 3)
+            prev_eval = prev_model.eval
             
             # Generate constraints for world states
-            if hasattr(semantics, 'is_world'):
-                for combination in self._generate_input_combinations(1, N):
-                    state = combination[0]
+            for is_world_expr in self._get_world_terms():
+                prev_value = prev_eval(is_world_expr, model_completion=True)
+                
+                if z3.is_true(prev_value):
+                    # Previous model had this as world, new model should not
+                    constraints.append(z3.Not(is_world_expr))
+                else:
+                    # Previous model didn't have this as world, new model should
+                    constraints.append(is_world_expr)
                     
-                    # Get the is_world expression
-                    is_world_expr = semantics.is_world(state)
-                    if is_world_expr is None:
-                        continue
-                        
-                    try:
-                        prev_value = prev_model.eval(is_world_expr, model_completion=True)
-                        
-                        if z3.is_true(prev_value):
-                            # Previous model had this as world, new model should not
-                            not_world_expr = z3.Not(is_world_expr)
-                            if not_world_expr is not None:
-                                constraints.append(not_world_expr)
-                        else:
-                            # Previous model didn't have this as world, new model should
-                            if is_world_expr is not None:
-                                constraints.append(is_world_expr)
-                    except Exception as eval_error:
-                        logger.warning(f"Error evaluating is_world({state}): {eval_error}")
-                        continue
-                        
         except Exception as e:
             logger.warning(f"Error creating state difference constraints: {e}")
             
@@ -209,36 +208,19 @@ class ConstraintGenerator:
             z3.BoolRef or None: Non-isomorphic constraint
         """
         try:
-            # Get semantics from the build example
-            semantics = self.build_example.model_constraints.semantics
-            N = self.build_example.settings.get('N', 3)
+            iso_eval = isomorphic_model.eval
             
             # Create constraint that forces at least one difference
             difference_constraints = []
             
-            if hasattr(semantics, 'is_world'):
-                for combination in self._generate_input_combinations(1, N):
-                    state = combination[0]
+            for is_world_expr in self._get_world_terms():
+                iso_value = iso_eval(is_world_expr, model_completion=True)
+                
+                if z3.is_true(iso_value):
+                    difference_constraints.append(z3.Not(is_world_expr))
+                else:
+                    difference_constraints.append(is_world_expr)
                     
-                    # Get the is_world expression
-                    is_world_expr = semantics.is_world(state)
-                    if is_world_expr is None:
-                        continue
-                        
-                    try:
-                        iso_value = isomorphic_model.eval(is_world_expr, model_completion=True)
-                        
-                        if z3.is_true(iso_value):
-                            not_world_expr = z3.Not(is_world_expr)
-                            if not_world_expr is not None:
-                                difference_constraints.append(not_world_expr)
-                        else:
-                            if is_world_expr is not None:
-                                difference_constraints.append(is_world_expr)
-                    except Exception as eval_error:
-                        logger.warning(f"Error evaluating is_world({state}) in isomorphic constraint: {eval_error}")
-                        continue
-                        
             if difference_constraints:
                 # Filter out any None or invalid constraints - check if they are valid Z3 expressions
                 valid_constraints = []
@@ -261,6 +243,31 @@ class ConstraintGenerator:
             
         return None
     
+    def _get_world_terms(self):
+        """Get the is_world term of each state, building them on first use.
+        
+        Every difference and non-isomorphic constraint compares the same
+        is_world terms against some model, so they are built once per
+        generator and only the evaluated values change between models.
+        
+        Returns:
+            list: The is_world terms, empty if the semantics has no is_world
+        """
+        if self._world_terms is None:
+            # Get semantics from the build example
+            semantics = self.build_example.model_constraints.semantics
+            N = self.build_example.settings.get('N', 3)
+            
+            world_terms = []
+            if hasattr(semantics, 'is_world'):
+                for combination in self._generate_input_combinations(1, N):
+                    # Get the is_world expression
+                    is_world_expr = semantics.is_world(combination[0])
+                    if is_world_expr is not None:
+                        world_terms.append(is_world_expr)
+            self._world_terms = world_terms
+        return self._world_terms
+    
     def _generate_input_combinations(self, arity, domain_size):
         """Generate all possible input combinations for given arity and domain.
         
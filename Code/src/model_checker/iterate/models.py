@@ -262,6 +262,32 @@ class ModelBuilder:
             return False
 
 
+def state_set(structure, attribute):
+    """Get a structure's state list as a frozenset, cached on the structure.
+    
+    Each structure is compared once as the new model and again as the
+    previous model, so its state sets are built once and reused. The cache
+    is keyed on the list object, so reassigning the attribute rebuilds it.
+    
+    Args:
+        structure: Model structure holding the state list
+        attribute: Name of the list, e.g. 'z3_world_states'
+        
+    Returns:
+        frozenset: The states, empty if the structure has no such list
+    """
+    states = getattr(structure, attribute, None) or []
+    cache = getattr(structure, '_state_set_cache', None)
+    if not isinstance(cache, dict):
+        cache = {}
+        structure._state_set_cache = cache
+    cached = cache.get(attribute)
+    if cached is None or cached[0] is not states:
+        cached = (states, frozenset(states))
+        cache[attribute] = cached
+    return cached[1]
+
+
 class DifferenceCalculator:
     """Calculates differences between model structures."""
     
@@ -310,8 +336,8 @@ class DifferenceCalculator:
         
         try:
             # World state differences
-            new_worlds = set(getattr(new_structure, 'z3_world_states', []))
-            prev_worlds = set(getattr(previous_structure, 'z3_world_states', []))
+            new_worlds = state_set(new_structure, 'z3_world_states')
+            prev_worlds = state_set(previous_structure, 'z3_world_states')
             
             world_added = new_worlds - prev_worlds
             world_removed = prev_worlds - new_worlds
@@ -323,8 +349,8 @@ class DifferenceCalculator:
             }
             
             # Possible state differences
-            new_possible = set(getattr(new_structure, 'z3_possible_states', []))
-            prev_possible = set(getattr(previous_structure, 'z3_possible_states', []))
+            new_possible = state_set(new_structure, 'z3_possible_states')
+            prev_possible = state_set(previous_structure, 'z3_possible_states')
             
             possible_added = new_possible - prev_possible
             possible_removed = prev_possible - new_possible
@@ -405,8 +431,8 @@ class DifferenceCalculator:
         
         try:
             # Count of impossible states
-            new_impossible = set(getattr(new_structure, 'z3_impossible_states', []))
-            prev_impossible = set(getattr(previous_structure, 'z3_impossible_states', []))
+            new_impossible = state_set(new_structure, 'z3_impossible_states')
+            prev_impossible = state_set(previous_structure, 'z3_impossible_states')
             
             if new_impossible != prev_impossible:
                 differences['impossible_state_changes'] = {
@@ -433,8 +459,8 @@ class DifferenceCalculator:
         
         try:
             # Get all states from both structures
-            new_worlds = set(getattr(new_structure, 'z3_world_states', []))
-            prev_worlds = set(getattr(previous_structure, 'z3_world_states', []))
+            new_worlds = state_set(new_structure, 'z3_world_states')
+            prev_worlds = state_set(previous_structure, 'z3_world_states')
             all_states = new_worlds.union(prev_worlds)
             
             for state in all_states:
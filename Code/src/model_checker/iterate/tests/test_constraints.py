@@ -58,7 +58,28 @@ class TestConstraintGenerator:
             # Should create one difference constraint per previous model
             assert len(extended) == 2  # One constraint per previous model
             assert all(z3.is_false(constraint) for constraint in extended)
-    
+
+    def test_create_extended_constraints_skips_excluded_models(self):
+        """Test that models already excluded are not constrained again."""
+        mock_example = Mock()
+        mock_example.model_constraints = Mock()
+        mock_example.model_constraints.all_constraints = [z3.BoolVal(True)]
+        mock_example.model_structure = Mock()
+        mock_example.model_structure.solver = z3.Solver()
+        mock_example.settings = {}
+
+        gen = ConstraintGenerator(mock_example)
+
+        with patch.object(gen, '_create_difference_constraint', return_value=z3.BoolVal(False)) as mock_diff:
+            first_model, second_model = Mock(), Mock()
+            assert len(gen.create_extended_constraints([first_model])) == 1
+
+            # Only the newly found model needs a difference constraint
+            extended = gen.create_extended_constraints([first_model, second_model])
+            assert len(extended) == 1
+            assert mock_diff.call_count == 2
+            mock_diff.assert_called_with([second_model])
+
     def test_check_satisfiability(self):
         """Test satisfiability checking."""
         mock_example = Mock()
@@ -172,6 +193,36 @@ class TestConstraintGenerator:
         # Should create a constraint
         assert constraint is not None
     
+    def test_world_terms_shared_across_models(self):
+        """Test that is_world terms are built once for all constraints."""
+        mock_example = Mock()
+        mock_example.model_constraints = Mock()
+        mock_example.model_constraints.all_constraints = []
+        mock_example.model_structure = Mock()
+        mock_example.model_structure.solver = z3.Solver()
+        mock_example.settings = {'N': 3}
+        
+        mock_semantics = Mock()
+        mock_semantics.is_world = Mock(side_effect=lambda s: z3.Bool(f"is_world_{s}"))
+        mock_example.model_constraints.semantics = mock_semantics
+        
+        gen = ConstraintGenerator(mock_example)
+        
+        true_model = Mock()
+        true_model.eval = Mock(return_value=z3.BoolVal(True))
+        false_model = Mock()
+        false_model.eval = Mock(return_value=z3.BoolVal(False))
+        
+        first = gen._create_difference_constraint([true_model])
+        second = gen._create_difference_constraint([false_model])
+        gen._create_non_isomorphic_constraint(true_model)
+        
+        # Each state's term is built once and each model still gets its own constraint
+        assert mock_semantics.is_world.call_count == 3
+        worlds = [z3.Bool(f"is_world_{s}") for s in range(3)]
+        assert first.eq(z3.Or([z3.Not(w) for w in worlds]))
+        assert second.eq(z3.Or(worlds))
+    
     def test_create_stronger_constraint(self):
         """Test stronger constraint creation for escaping isomorphism."""
         mock_example = Mock()
@@ -3,7 +3,7 @@
 import pytest
 import z3
 from unittest.mock import Mock, patch, MagicMock
-from model_checker.iterate.models import ModelBuilder, DifferenceCalculator
+from model_checker.iterate.models import ModelBuilder, DifferenceCalculator, state_set
 
 
 class TestModelBuilder:
@@ -274,4 +274,27 @@ class TestDifferenceCalculator:
         
         # States 0 and 2 unchanged (not in comparisons)
         assert 'state_0' not in comparisons
-        assert 'state_2' not in comparisons
\ No newline at end of file
+        assert 'state_2' not in comparisons
+
+
+class TestStateSet:
+    """Test cases for the cached structure state sets."""
+    
+    def test_state_set_is_cached_per_list(self):
+        """Test that a state set is reused until its list is replaced."""
+        struct = Mock()
+        struct.z3_world_states = [0, 1]
+        
+        worlds = state_set(struct, 'z3_world_states')
+        assert worlds == frozenset({0, 1})
+        assert state_set(struct, 'z3_world_states') is worlds
+        
+        # Replacing the list rebuilds the set
+        struct.z3_world_states = [2]
+        assert state_set(struct, 'z3_world_states') == frozenset({2})
+    
+    def test_state_set_missing_states(self):
+        """Test that a structure without states gives an empty set."""
+        struct = Mock()
+        struct.z3_possible_states = None
+        assert state_set(struct, 'z3_possible_states') == frozenset()
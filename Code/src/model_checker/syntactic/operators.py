@@ -26,7 +26,9 @@ class Operator:
     - true_at/false_at: For truth/falsity conditions
     - extended_verify/extended_falsify: For hyperintensional semantics 
     - find_verifiers_and_falsifiers: For finding exact verification sets
-    - print_method: For displaying evaluation details
+    
+    Operators whose evaluation ranges over other worlds or times should also
+    override print_method, which defaults to general_print.
     
     Class Attributes:
         name (str): The symbol representing this operator
@@ -66,6 +68,10 @@ class Operator:
     def __hash__(self):
         return hash((self.name, self.arity))
 
+    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
+        """Prints the proposition and its arguments using general_print."""
+        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
+
     def general_print(self, sentence_obj, eval_point, indent_num, use_colors):
         """Prints a general evaluation of a sentence at a given evaluation point.
 
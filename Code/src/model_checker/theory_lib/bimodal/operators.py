@@ -29,6 +29,8 @@ All operators adhere to a fail-fast philosophy, raising explicit errors when
 required data is missing or invalid rather than attempting fallbacks.
 """
 
+import bisect
+
 import z3
 
 
@@ -39,6 +41,31 @@ from model_checker.utils import pretty_set_print
 ############################ EXTENSIONAL OPERATORS ###########################
 ##############################################################################
 
+def _sorted_union(left_times, right_times):
+    """Merges two ascending lists of times into their ascending union.
+
+    Extensions always list their true and false times in ascending order, so
+    a single pass over both lists suffices.
+    """
+    union = []
+    i, j = 0, 0
+    left_len, right_len = len(left_times), len(right_times)
+    while i < left_len and j < right_len:
+        left_time, right_time = left_times[i], right_times[j]
+        if left_time < right_time:
+            union.append(left_time)
+            i += 1
+        elif right_time < left_time:
+            union.append(right_time)
+            j += 1
+        else:
+            union.append(left_time)
+            i += 1
+            j += 1
+    union.extend(left_times[i:])
+    union.extend(right_times[j:])
+    return union
+
 class NegationOperator(syntactic.Operator):
     """Logical negation operator that inverts the truth value of its argument.
     
@@ -93,16 +120,21 @@ class NegationOperator(syntactic.Operator):
             dict: A dictionary mapping world_ids to (true_times, false_times) pairs,
                  where the true and false times are swapped from the argument's extension
         """
+        argument_extension = argument.proposition.extension
+        semantics = argument.proposition.model_structure.semantics
+        
+        # The negations of the extremal extensions are each other
+        if argument_extension is semantics.all_false:
+            return semantics.all_true
+        if argument_extension is semantics.all_true:
+            return semantics.all_false
+        
         new_truth_condition = {}
-        for world_id, temporal_profile in argument.proposition.extension.items():
+        for world_id, temporal_profile in argument_extension.items():
             true_times, false_times = temporal_profile
             new_truth_condition[world_id] = (false_times, true_times)
         return new_truth_condition
 
-    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
-        """Prints the proposition and its arguments."""
-        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
-
 
 class AndOperator(syntactic.Operator):
     """Logical conjunction operator that returns true when both arguments are true.
@@ -175,26 +207,29 @@ class AndOperator(syntactic.Operator):
         """
         leftarg_truth_condition = leftarg.proposition.extension
         rightarg_truth_condition = rightarg.proposition.extension
-        new_truth_condition = {}
+        semantics = leftarg.proposition.model_structure.semantics
+        
+        # Bottom is an annihilator for conjunction
+        if (leftarg_truth_condition is semantics.all_false
+                or rightarg_truth_condition is semantics.all_false):
+            return semantics.all_false
         
+        new_truth_condition = {}
         for world_id, temporal_profile in leftarg_truth_condition.items():
             left_true_times, left_false_times = temporal_profile
             right_true_times, right_false_times = rightarg_truth_condition[world_id]
             
             # Find intersection while preserving order from left_true_times
-            new_true_times = [t for t in left_true_times if t in right_true_times]
+            right_true_set = set(right_true_times)
+            new_true_times = [t for t in left_true_times if t in right_true_set]
             
-            # Find union while preserving order and removing duplicates
-            new_false_times = sorted(set(left_false_times) | set(right_false_times))
+            # Merge the ascending false times into their ascending union
+            new_false_times = _sorted_union(left_false_times, right_false_times)
             
             new_truth_condition[world_id] = (new_true_times, new_false_times)
             
         return new_truth_condition
 
-    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
-        """Prints the proposition and its arguments."""
-        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
-
 
 class OrOperator(syntactic.Operator):
     """Logical disjunction operator that returns true when at least one argument is true.
@@ -267,25 +302,28 @@ class OrOperator(syntactic.Operator):
         """
         leftarg_truth_condition = leftarg.proposition.extension
         rightarg_truth_condition = rightarg.proposition.extension
-        new_truth_condition = {}
+        semantics = leftarg.proposition.model_structure.semantics
         
+        # Top is an annihilator for disjunction
+        if (leftarg_truth_condition is semantics.all_true
+                or rightarg_truth_condition is semantics.all_true):
+            return semantics.all_true
+        
+        new_truth_condition = {}
         for world_id, temporal_profile in leftarg_truth_condition.items():
             left_true_times, left_false_times = temporal_profile
             right_true_times, right_false_times = rightarg_truth_condition[world_id]
             
-            # Find union of true times
-            new_true_times = sorted(set(left_true_times) | set(right_true_times))
+            # Merge the ascending true times into their ascending union
+            new_true_times = _sorted_union(left_true_times, right_true_times)
             
-            # Find intersection of false times
-            new_false_times = [t for t in left_false_times if t in right_false_times]
+            # Find intersection of false times while preserving order from left_false_times
+            right_false_set = set(right_false_times)
+            new_false_times = [t for t in left_false_times if t in right_false_set]
             
             new_truth_condition[world_id] = (new_true_times, new_false_times)
             
         return new_truth_condition
-    
-    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
-        """Prints the proposition and its arguments."""
-        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
 
 
 ##############################################################################
@@ -312,24 +350,12 @@ class BotOperator(syntactic.Operator):
     arity = 0
 
     def true_at(self, eval_point):
-        """Returns true if world state != itself (always false)."""
-        # Extract world and time from eval_point
-        eval_world = eval_point["world"]
-        eval_time = eval_point["time"]
-        # Get the world array from the world ID
-        world_array = self.semantics.world_function(eval_world)
-        world_state = z3.Select(world_array, eval_time)
-        return world_state != world_state
+        """Returns the constant false formula (bottom is never true)."""
+        return z3.BoolVal(False)
 
     def false_at(self, eval_point):
-        """Returns true if world state == itself (always true)."""
-        # Extract world and time from eval_point
-        eval_world = eval_point["world"]
-        eval_time = eval_point["time"]
-        # Get the world array from the world ID
-        world_array = self.semantics.world_function(eval_world)
-        world_state = z3.Select(world_array, eval_time)
-        return world_state == world_state
+        """Returns the constant true formula (bottom is always false)."""
+        return z3.BoolVal(True)
 
     def find_truth_condition(self, eval_point):
         """Returns the extension where all times are false at all worlds.
@@ -345,10 +371,6 @@ class BotOperator(syntactic.Operator):
         """
         return self.semantics.all_false
 
-    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
-        """Prints the proposition and its arguments."""
-        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
-
 
 
 ##############################################################################
@@ -449,32 +471,22 @@ class NecessityOperator(syntactic.Operator):
         # Initialize result dictionary to eventually return
         new_truth_condition = {}
 
+        # Collect the times at which the argument is false in some possible world
+        falsified_times = set()
+        for any_world in all_worlds:
+            falsified_times.update(argument_extension[any_world][1])
+
         # For each world in the model
         for current_world in all_worlds:
-            # Get the time interval for this world
-            start_time, end_time = semantics.world_time_intervals[current_world]
-            # Generate a list of all valid times for this world
-            world_time_interval = list(range(start_time, end_time + 1))
+            # Get the range of valid times for this world
+            world_time_interval = semantics.world_time_ranges[current_world]
             # # Skip worlds that do not include the eval_time
             # if eval_time not in world_time_interval:
             #     continue
-            # Initialize lists to store times when necessity is true/false
-            true_times, false_times = [], []
-
-            # For each time point in this world's interval
-            for test_time in world_time_interval:
-                # Check if argument is false at this time in any possible world
-                is_false_in_some_world = any(
-                    test_time in argument_extension[any_world][1]
-                    for any_world in all_worlds
-                )
-                # If false in any world
-                if is_false_in_some_world:
-                    # Then the necessity is false at this time
-                    false_times.append(test_time)
-                else:
-                    # Otherwise the necessity is true at this time
-                    true_times.append(test_time)
+            # Necessity is false at the times the argument is false in any
+            # possible world, and true at all other times in this interval
+            true_times = [t for t in world_time_interval if t not in falsified_times]
+            false_times = [t for t in world_time_interval if t in falsified_times]
 
             # Store the temporal profile for this world
             new_truth_condition[current_world] = (true_times, false_times)
@@ -500,6 +512,77 @@ class NecessityOperator(syntactic.Operator):
 ############################## TENSE OPERATORS ###############################
 ##############################################################################
 
+def _always_truth_condition(argument, toward_future):
+    """Computes the temporal profile of 'always' in one direction of time.
+    
+    A time is true if the argument is never false at any time strictly later
+    (toward_future) or strictly earlier (otherwise) in the same world interval,
+    and false otherwise. Since the false times are ascending, each world only
+    needs a binary search for the false time nearest the far end.
+    
+    Args:
+        argument: The argument sentence with a computed proposition extension
+        toward_future (bool): True for the future direction, False for the past
+        
+    Returns:
+        dict: A dictionary mapping world_ids to (true_times, false_times) pairs
+        
+    Raises:
+        KeyError: If world_time_ranges information is missing for a world_id.
+                  This follows the fail-fast philosophy to make errors explicit.
+    """
+    semantics = argument.proposition.model_structure.semantics
+    truth_condition = {}
+    
+    # For any current_world with a temporal_profile of true and false times
+    for current_world, temporal_profile in argument.proposition.extension.items():
+        _, false_times = temporal_profile
+        
+        # Find the time_interval and its bounds for the current_world
+        time_interval = semantics.world_time_ranges[current_world]
+        start_time, stop_time = time_interval.start, time_interval.stop
+        
+        # The false times are ascending, so the false time nearest the far end
+        # of the interval decides the whole profile: times from it to the far
+        # end have no false time beyond them, and all nearer times do.
+        if toward_future:
+            index = bisect.bisect_left(false_times, stop_time)
+            if index == 0 or false_times[index - 1] < start_time:
+                truth_condition[current_world] = (list(time_interval), [])
+                continue
+            boundary = false_times[index - 1]
+            new_true_times = list(range(boundary, stop_time))
+            new_false_times = list(range(start_time, boundary))
+        else:
+            index = bisect.bisect_left(false_times, start_time)
+            if index == len(false_times) or false_times[index] >= stop_time:
+                truth_condition[current_world] = (list(time_interval), [])
+                continue
+            boundary = false_times[index]
+            new_true_times = list(range(start_time, boundary + 1))
+            new_false_times = list(range(boundary + 1, stop_time))
+        
+        # Store the results for this world_id
+        truth_condition[current_world] = (new_true_times, new_false_times)
+    
+    return truth_condition
+
+
+def _print_over_world_times(operator, sentence_obj, eval_point, indent_num, use_colors):
+    """Prints a tense operator's argument at every time in the eval_world.
+    
+    Args:
+        operator: The tense operator whose sentence is being printed
+        sentence_obj: The sentence to print
+        eval_point: The evaluation point (world ID and time)
+        indent_num: The indentation level
+        use_colors: Whether to use colors in output
+    """
+    eval_world = eval_point["world"]
+    eval_world_history = sentence_obj.proposition.model_structure.get_world_history(eval_world)
+    operator.print_over_times(sentence_obj, eval_point, eval_world_history.keys(), indent_num, use_colors)
+
+
 class FutureOperator(syntactic.Operator):
     """Temporal operator that evaluates whether a formula holds at all future times.
 
@@ -592,64 +675,14 @@ class FutureOperator(syntactic.Operator):
                  future times and the time is in the false_times otherwise
                  
         Raises:
-            KeyError: If world_time_intervals information is missing for a required world_id.
+            KeyError: If world_time_ranges information is missing for a required world_id.
                       This follows the fail-fast philosophy to make errors explicit.
         """
-        model_structure = argument.proposition.model_structure
-        semantics = model_structure.semantics
-        argument_extension = argument.proposition.extension
-        truth_condition = {}
-        
-        # For any current_world with a temporal_profile of true and false times
-        for current_world, temporal_profile in argument_extension.items():
-            true_times, false_times = temporal_profile
-            
-            # Start with empty lists for past/future times
-            new_true_times, new_false_times = [], []
-            
-            # Find the time_interval for the current_world
-            start_time, end_time = semantics.world_time_intervals[current_world]
-            time_interval = list(range(start_time, end_time + 1))
-            
-            # Calculate which times the argument always will be true
-            for time_point in time_interval:
-
-                # Check if there are any world_times strictly after this time_point
-                has_future_times = any(any_time > time_point for any_time in time_interval)
-                
-                # If there are no future times in this world's interval, the Future operator is vacuously true
-                if not has_future_times:
-                    new_true_times.append(time_point)
-                    continue
-                    
-                # Find all false times that are after this time point
-                future_false_times = [
-                    any_time
-                    for any_time in false_times
-                    if any_time > time_point
-                    and any_time in time_interval
-                ]
-                
-                # If there are no false times in the future
-                if not future_false_times:
-                    # Add time_point to the new_true_times
-                    new_true_times.append(time_point)
-                else:
-                    # Otherwise add time_point to the new_false_times
-                    new_false_times.append(time_point)
-            
-            # Store the results for this world_id
-            truth_condition[current_world] = (new_true_times, new_false_times)
-
-        # Return result dictionary
-        return truth_condition
+        return _always_truth_condition(argument, toward_future=True)
     
     def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
         """Print temporal operator evaluation across different time points."""
-        eval_world = eval_point["world"]
-        eval_world_history = sentence_obj.proposition.model_structure.get_world_history(eval_world)
-        eval_world_times = eval_world_history.keys()
-        self.print_over_times(sentence_obj, eval_point, eval_world_times, indent_num, use_colors)
+        _print_over_world_times(self, sentence_obj, eval_point, indent_num, use_colors)
 
 
 class PastOperator(syntactic.Operator):
@@ -752,57 +785,10 @@ class PastOperator(syntactic.Operator):
                  past times and the time is in the false_times otherwise
                  
         Raises:
-            KeyError: If world_time_intervals information is missing for a world_id.
+            KeyError: If world_time_ranges information is missing for a world_id.
                      This follows the fail-fast philosophy to make errors explicit.
         """
-        model_structure = argument.proposition.model_structure
-        semantics = model_structure.semantics
-        argument_extension = argument.proposition.extension
-        truth_condition = {}
-        
-        # For any current_world with a temporal_profile of true and false times
-        for current_world, temporal_profile in argument_extension.items():
-            true_times, false_times = temporal_profile
-            
-            # Start with empty lists for past/future times
-            new_true_times, new_false_times = [], []
-            
-            # Find the time_interval for the current_world
-            start_time, end_time = semantics.world_time_intervals[current_world]
-            time_interval = list(range(start_time, end_time + 1))
-            
-            # Calculate which times the argument always has been true
-            for time_point in time_interval:
-
-                # Check if there are any world_times strictly before this time_point
-                has_past_times = any(any_time < time_point for any_time in time_interval)
-                
-                # If there are no past times in this world's interval, the Past operator is vacuously true
-                if not has_past_times:
-                    new_true_times.append(time_point)
-                    continue
-                    
-                # Find all false times that are before this time point
-                past_false_times = [
-                    any_time
-                    for any_time in false_times
-                    if any_time < time_point
-                    and any_time in time_interval
-                ]
-                
-                # If there are no false times in the past
-                if not past_false_times:
-                    # Add time_point to the new_true_times
-                    new_true_times.append(time_point)
-                else:
-                    # Otherwise add time_point to the new_false_times
-                    new_false_times.append(time_point)
-            
-            # Store the results for this world_id
-            truth_condition[current_world] = (new_true_times, new_false_times)
-
-        # Return result dictionary
-        return truth_condition
+        return _always_truth_condition(argument, toward_future=False)
     
     def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
         """Print the sentence over all time points.
@@ -813,10 +799,7 @@ class PastOperator(syntactic.Operator):
             indent_num: The indentation level
             use_colors: Whether to use colors in output
         """
-        eval_world = eval_point["world"]
-        eval_world_history = sentence_obj.proposition.model_structure.get_world_history(eval_world)
-        eval_world_times = eval_world_history.keys()
-        self.print_over_times(sentence_obj, eval_point, eval_world_times, indent_num, use_colors)
+        _print_over_world_times(self, sentence_obj, eval_point, indent_num, use_colors)
 
 
 
@@ -850,11 +833,6 @@ class ConditionalOperator(syntactic.DefinedOperator):
 
     def derived_definition(self, leftarg, rightarg):  # type: ignore
         return [OrOperator, [NegationOperator, leftarg], rightarg]
-    
-    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
-        """Prints the proposition for sentence_obj, increases the indentation
-        by 1, and prints both of the arguments."""
-        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
 
 
 class BiconditionalOperator(syntactic.DefinedOperator):
@@ -883,11 +861,6 @@ class BiconditionalOperator(syntactic.DefinedOperator):
         right_to_left = [ConditionalOperator, leftarg, rightarg]
         left_to_right = [ConditionalOperator, rightarg, leftarg]
         return [AndOperator, right_to_left, left_to_right]
-    
-    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
-        """Prints the proposition for sentence_obj, increases the indentation
-        by 1, and prints both of the arguments."""
-        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
 
 
 
@@ -918,10 +891,6 @@ class TopOperator(syntactic.DefinedOperator):
         """Define top in terms of negation and bottom."""
         return [NegationOperator, [BotOperator]]
 
-    def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
-        """Prints the proposition and its arguments."""
-        self.general_print(sentence_obj, eval_point, indent_num, use_colors)
-
 
 
 ##############################################################################
@@ -1005,10 +974,7 @@ class DefFutureOperator(syntactic.DefinedOperator):
     
     def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
         """Print temporal operator evaluation across different time points."""
-        eval_world = eval_point["world"]
-        eval_world_history = sentence_obj.proposition.model_structure.get_world_history(eval_world)
-        eval_world_times = eval_world_history.keys()
-        self.print_over_times(sentence_obj, eval_point, eval_world_times, indent_num, use_colors)
+        _print_over_world_times(self, sentence_obj, eval_point, indent_num, use_colors)
 
 
 class DefPastOperator(syntactic.DefinedOperator):
@@ -1021,10 +987,7 @@ class DefPastOperator(syntactic.DefinedOperator):
     
     def print_method(self, sentence_obj, eval_point, indent_num, use_colors):
         """Print temporal operator evaluation across different time points."""
-        eval_world = eval_point["world"]
-        eval_world_history = sentence_obj.proposition.model_structure.get_world_history(eval_world)
-        eval_world_times = eval_world_history.keys()
-        self.print_over_times(sentence_obj, eval_point, eval_world_times, indent_num, use_colors)
+        _print_over_world_times(self, sentence_obj, eval_point, indent_num, use_colors)
 
 
 
@@ -1,5 +1,6 @@
 import sys
 import time
+import types
 import z3
 
 # Standard imports
@@ -91,6 +92,7 @@ class BimodalSemantics(SemanticDefaults):
         
         # Clear any cached world time intervals from previous examples
         self.world_time_intervals = {}
+        self.world_time_ranges = {}
         
         # Clear model cache values
         if hasattr(self, 'model_structure'):
@@ -188,6 +190,9 @@ class BimodalSemantics(SemanticDefaults):
         # Dictionary to store world time intervals after extraction
         self.world_time_intervals = {}
         
+        # Dictionary to store the range of times in each world's interval
+        self.world_time_ranges = {}
+        
         # Main point of evaluation includes a world ID and time
         self.main_world = 0             # Store world ID, not array reference
         self.main_time = z3.IntVal(0)   # Fix the main time to 0 
@@ -1051,11 +1056,15 @@ class BimodalSemantics(SemanticDefaults):
             z3_model: The Z3 model to extract from
             worlds: List of valid world IDs
             
+        Also records the range of times in each interval in world_time_ranges
+        so that operators can iterate over a world's times without rebuilding it.
+        
         Returns:
             dict: Mapping from world_id to (start_time, end_time) tuple
         """
-        # Reset time intervals dictionary
+        # Reset time intervals and ranges dictionaries
         self.world_time_intervals = {}
+        self.world_time_ranges = {}
         
         for world_id in all_worlds:
             try:
@@ -1067,6 +1076,7 @@ class BimodalSemantics(SemanticDefaults):
                 start_time = -self.M + 1
                 end_time = self.M - 1
                 self.world_time_intervals[world_id] = (start_time, end_time)
+            self.world_time_ranges[world_id] = range(start_time, end_time + 1)
         
         return self.world_time_intervals
     
@@ -1307,7 +1317,12 @@ class BimodalProposition(PropositionDefaults):
         self.eval_time = self.model_structure.main_time if eval_time == 'now' else eval_time
         
         # Calculate the extension (truth/falsity at each world and time)
-        self.extension = self.find_extension()
+        # Sentences shared between premises and subformulas are interpreted more
+        # than once, so reuse any extension already computed in this model
+        extension_cache = self.model_structure.extension_cache
+        if self.name not in extension_cache:
+            extension_cache[self.name] = self.find_extension()
+        self.extension = extension_cache[self.name]
         
         # TODO: adapt find_truth_condition in operators.py to use eval_point
         # Extract world states sets for use in representation
@@ -1397,19 +1412,22 @@ class BimodalProposition(PropositionDefaults):
                 true_times = []
                 false_times = []
                 
-                # Use the world time intervals from the semantics
-                if world_id in self.model_structure.semantics.world_time_intervals:
-                    start_time, end_time = self.model_structure.semantics.world_time_intervals[world_id]
-                    times_to_check = range(start_time, end_time + 1)
+                # Use the world time ranges recorded by the semantics
+                world_time_ranges = self.model_structure.semantics.world_time_ranges
+                if world_id in world_time_ranges:
+                    times_to_check = world_time_ranges[world_id]
                 else:
                     # If no interval information is available, let error propagate
                     times_to_check = self.model_structure.all_times
                 
+                # Reuse one eval_point per world since true_at does not retain it
+                eval_point = {"world" : world_id, "time" : None}
                 for time in times_to_check:
                     # Pass the world_id directly to the true_at method
                     # Allow Z3 exceptions to propagate naturally - fail fast
+                    eval_point["time"] = time
                     truth_expr = self.model_structure.semantics.true_at(
-                        self.sentence, {"world" : world_id, "time" : time}
+                        self.sentence, eval_point
                     )
                     evaluated_expr = self.z3_model.evaluate(truth_expr)
                     if z3.is_true(evaluated_expr):
@@ -1582,6 +1600,7 @@ class BimodalStructure(ModelDefaults):
         all_times (range): Range of available time points
         world_arrays (dict): Maps world_id (int) to world array (Z3 object)
         world_histories (dict): Maps world_id (int) to {time: world_state} mappings
+        extension_cache (dict): Maps sentence names to extensions computed in this model
     """
     def __init__(self, model_constraints, max_time=1):
         """Initialize a BimodalStructure with model constraints.
@@ -1609,6 +1628,7 @@ class BimodalStructure(ModelDefaults):
         self.world_arrays = {}  # Maps world_id (int) to world array (Z3 object)
         self.world_histories = {}  # Maps world_id (int) to {time: world_state} mappings
         self.time_shift_relations = {}  # Maps source_id to {shift: target_id}
+        self.extension_cache = {}  # Maps sentence names to their extensions
         self.main_world = 0  # Default main world_id
         
         # Initialize Z3 model values
@@ -1668,14 +1688,16 @@ class BimodalStructure(ModelDefaults):
                 # Set a placeholder value
                 self.z3_main_world_state = None
             
-            # Initialize the all_true and all_false dictionaries in the semantics
-            # These provide truth values for extremal operators (Top/Bot)
-            self.semantics.all_true = {}
-            self.semantics.all_false = {}
-            
-            for world_id in self.world_arrays:
-                self.semantics.all_true[world_id] = (list(self.all_times), [])
-                self.semantics.all_false[world_id] = ([], list(self.all_times))
+            # Initialize the all_true and all_false extensions in the semantics
+            # These provide truth values for extremal operators (Top/Bot) and are
+            # shared read-only by every proposition, so operators can recognize them
+            all_times = list(self.all_times)
+            self.semantics.all_true = types.MappingProxyType(
+                {world_id: (all_times, []) for world_id in self.world_arrays}
+            )
+            self.semantics.all_false = types.MappingProxyType(
+                {world_id: ([], all_times) for world_id in self.world_arrays}
+            )
     
     def get_world_array(self, world_id):
         """Get the world array for a given world_id.
@@ -0,0 +1,143 @@
+"""Tests for bimodal operator truth-condition computations."""
+
+import unittest
+from unittest.mock import Mock
+
+from model_checker.theory_lib.bimodal.operators import (
+    AndOperator,
+    FutureOperator,
+    NecessityOperator,
+    NegationOperator,
+    OrOperator,
+    PastOperator,
+)
+
+
+def make_argument(extension, world_time_intervals):
+    """Build a mock argument whose proposition carries the given extension."""
+    semantics = Mock()
+    semantics.world_time_intervals = world_time_intervals
+    semantics.world_time_ranges = {
+        world: range(start, end + 1)
+        for world, (start, end) in world_time_intervals.items()
+    }
+    argument = Mock()
+    argument.proposition.extension = extension
+    argument.proposition.model_structure.semantics = semantics
+    return argument
+
+
+class TestExtensionalTruthConditions(unittest.TestCase):
+    """Test find_truth_condition for the binary extensional operators."""
+
+    def setUp(self):
+        intervals = {0: (-1, 2)}
+        self.left = make_argument({0: ([-1, 0, 2], [1])}, intervals)
+        self.right = make_argument({0: ([0, 1], [-1, 2])}, intervals)
+        self.eval_point = {"world": 0, "time": 0}
+
+    def test_and_truth_condition(self):
+        """Conjunction intersects true times and unites false times."""
+        operator = AndOperator(Mock())
+        result = operator.find_truth_condition(self.left, self.right, self.eval_point)
+        self.assertEqual(result, {0: ([0], [-1, 1, 2])})
+
+    def test_or_truth_condition(self):
+        """Disjunction unites true times and intersects false times."""
+        operator = OrOperator(Mock())
+        result = operator.find_truth_condition(self.left, self.right, self.eval_point)
+        self.assertEqual(result, {0: ([-1, 0, 1, 2], [])})
+
+    def test_extremal_extensions_short_circuit(self):
+        """Bottom annihilates conjunction and top annihilates disjunction."""
+        semantics = self.left.proposition.model_structure.semantics
+        semantics.all_true = {0: ([-1, 0, 1, 2], [])}
+        semantics.all_false = {0: ([], [-1, 0, 1, 2])}
+        bot = make_argument(semantics.all_false, {0: (-1, 2)})
+        bot.proposition.model_structure.semantics = semantics
+
+        top_extension = NegationOperator(semantics).find_truth_condition(bot, self.eval_point)
+        self.assertIs(top_extension, semantics.all_true)
+        self.assertIs(
+            AndOperator(semantics).find_truth_condition(self.left, bot, self.eval_point),
+            semantics.all_false,
+        )
+        top = make_argument(top_extension, {0: (-1, 2)})
+        self.assertIs(
+            OrOperator(semantics).find_truth_condition(self.left, top, self.eval_point),
+            semantics.all_true,
+        )
+
+
+class TestModalTruthConditions(unittest.TestCase):
+    """Test find_truth_condition for the primitive modal operator."""
+
+    def test_necessity_truth_condition(self):
+        """Necessity is false at a time iff the argument is false there in some world."""
+        intervals = {0: (-1, 1), 1: (0, 2)}
+        argument = make_argument(
+            {0: ([-1, 0], [1]), 1: ([1, 2], [0])},
+            intervals,
+        )
+        argument.proposition.model_structure.world_arrays = intervals
+        operator = NecessityOperator(argument.proposition.model_structure.semantics)
+        result = operator.find_truth_condition(argument, {"world": 0, "time": 0})
+        self.assertEqual(result, {0: ([-1], [0, 1]), 1: ([2], [0, 1])})
+
+
+class TestTemporalTruthConditions(unittest.TestCase):
+    """Test find_truth_condition for the primitive tense operators."""
+
+    def setUp(self):
+        self.intervals = {0: (-2, 2), 1: (0, 3)}
+        self.extension = {
+            0: ([-2, 0, 1, 2], [-1]),
+            1: ([0, 1, 2, 3], []),
+        }
+        self.eval_point = {"world": 0, "time": 0}
+
+    def test_future_truth_condition(self):
+        """Future is true exactly at times with no later false time."""
+        argument = make_argument(self.extension, self.intervals)
+        operator = FutureOperator(argument.proposition.model_structure.semantics)
+        result = operator.find_truth_condition(argument, self.eval_point)
+        self.assertEqual(result[0], ([-1, 0, 1, 2], [-2]))
+        self.assertEqual(result[1], ([0, 1, 2, 3], []))
+
+    def test_past_truth_condition(self):
+        """Past is true exactly at times with no earlier false time."""
+        argument = make_argument(self.extension, self.intervals)
+        operator = PastOperator(argument.proposition.model_structure.semantics)
+        result = operator.find_truth_condition(argument, self.eval_point)
+        self.assertEqual(result[0], ([-2, -1], [0, 1, 2]))
+        self.assertEqual(result[1], ([0, 1, 2, 3], []))
+
+    def test_false_times_outside_interval_are_ignored(self):
+        """Only false times within the world's own interval bound the profile."""
+        argument = make_argument({0: ([0], [-3, -1, 1, 3])}, {0: (-1, 1)})
+        semantics = argument.proposition.model_structure.semantics
+        self.assertEqual(
+            FutureOperator(semantics).find_truth_condition(argument, self.eval_point),
+            {0: ([1], [-1, 0])},
+        )
+        self.assertEqual(
+            PastOperator(semantics).find_truth_condition(argument, self.eval_point),
+            {0: ([-1], [0, 1])},
+        )
+
+    def test_single_time_interval_is_vacuously_true(self):
+        """A world with a single time has no past or future times."""
+        argument = make_argument({0: ([], [5])}, {0: (5, 5)})
+        semantics = argument.proposition.model_structure.semantics
+        self.assertEqual(
+            FutureOperator(semantics).find_truth_condition(argument, self.eval_point),
+            {0: ([5], [])},
+        )
+        self.assertEqual(
+            PastOperator(semantics).find_truth_condition(argument, self.eval_point),
+            {0: ([5], [])},
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
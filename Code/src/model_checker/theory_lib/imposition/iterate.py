@@ -6,12 +6,15 @@ This module provides the ImpositionModelIterator implementation which handles:
 3. Checking model isomorphism for imposition theory models
 """
 
+import itertools
 import z3
 import sys
 import logging
 
 from model_checker.iterate.core import BaseModelIterator
+from model_checker.iterate.models import state_set
 from model_checker.utils import bitvec_to_substates, pretty_set_print
+from model_checker.theory_lib.imposition.semantic import describe_imposition_change
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -22,6 +25,9 @@ if not logger.handlers:
     logger.addHandler(handler)
     logger.setLevel(logging.WARNING)
 
+# Color of a gained or lost imposition in the difference display
+_CHANGE_COLORS = {"+": "\033[32m", "-": "\033[31m"}
+
 
 class ImpositionModelIterator(BaseModelIterator):
     """Model iterator for the imposition theory.
@@ -88,8 +94,8 @@ class ImpositionModelIterator(BaseModelIterator):
         }
         
         # Compare worlds and possible states
-        old_worlds = set(getattr(previous_structure, "z3_world_states", []))
-        new_worlds = set(getattr(new_structure, "z3_world_states", []))
+        old_worlds = state_set(previous_structure, "z3_world_states")
+        new_worlds = state_set(new_structure, "z3_world_states")
         
         # Find added/removed worlds
         for world in new_worlds:
@@ -101,8 +107,8 @@ class ImpositionModelIterator(BaseModelIterator):
                 differences["worlds"]["removed"].append(world)
         
         # Compare possible states
-        old_states = set(getattr(previous_structure, "z3_possible_states", []))
-        new_states = set(getattr(new_structure, "z3_possible_states", []))
+        old_states = state_set(previous_structure, "z3_possible_states")
+        new_states = state_set(new_structure, "z3_possible_states")
         
         # Find added/removed possible states
         for state in new_states:
@@ -116,6 +122,16 @@ class ImpositionModelIterator(BaseModelIterator):
         # Compare verification and falsification for each sentence letter
         all_states = list(old_states.union(new_states))
         
+        # Split the states once into those possible in both models and those
+        # possible in only one, where the other model counts as not relating.
+        # Each region keeps its structure's state order, so the added and
+        # removed lists do not depend on set iteration order
+        old_state_list = getattr(previous_structure, "z3_possible_states", None) or []
+        new_state_list = getattr(new_structure, "z3_possible_states", None) or []
+        common_states = [state for state in new_state_list if state in old_states]
+        old_only_states = [state for state in old_state_list if state not in new_states]
+        new_only_states = [state for state in new_state_list if state not in old_states]
+        
         for letter in new_structure.sentence_letters:
             try:
                 # Get the atom for this letter
@@ -128,25 +144,10 @@ class ImpositionModelIterator(BaseModelIterator):
                 letter_str = str(letter)
                 
                 # Check verification changes
-                verify_added = []
-                verify_removed = []
-                
-                for state in all_states:
-                    try:
-                        old_verify = False
-                        new_verify = False
-                        
-                        if state in old_states:
-                            old_verify = bool(previous_model.eval(semantics.verify(state, atom), model_completion=True))
-                        if state in new_states:
-                            new_verify = bool(new_model.eval(semantics.verify(state, atom), model_completion=True))
-                        
-                        if not old_verify and new_verify:
-                            verify_added.append(state)
-                        elif old_verify and not new_verify:
-                            verify_removed.append(state)
-                    except:
-                        pass
+                verify_added, verify_removed = self._compare_letter_relation(
+                    semantics.verify, atom, previous_model, new_model,
+                    common_states, old_only_states, new_only_states
+                )
                 
                 if verify_added or verify_removed:
                     differences["verification"][letter_str] = {
@@ -155,25 +156,10 @@ class ImpositionModelIterator(BaseModelIterator):
                     }
                 
                 # Check falsification changes
-                falsify_added = []
-                falsify_removed = []
-                
-                for state in all_states:
-                    try:
-                        old_falsify = False
-                        new_falsify = False
-                        
-                        if state in old_states:
-                            old_falsify = bool(previous_model.eval(semantics.falsify(state, atom), model_completion=True))
-                        if state in new_states:
-                            new_falsify = bool(new_model.eval(semantics.falsify(state, atom), model_completion=True))
-                        
-                        if not old_falsify and new_falsify:
-                            falsify_added.append(state)
-                        elif old_falsify and not new_falsify:
-                            falsify_removed.append(state)
-                    except:
-                        pass
+                falsify_added, falsify_removed = self._compare_letter_relation(
+                    semantics.falsify, atom, previous_model, new_model,
+                    common_states, old_only_states, new_only_states
+                )
                 
                 if falsify_added or falsify_removed:
                     differences["falsification"][letter_str] = {
@@ -186,40 +172,95 @@ class ImpositionModelIterator(BaseModelIterator):
                 
         # Compare imposition relationships if available
         if hasattr(semantics, 'imposition'):
-            for i, state1 in enumerate(all_states):
-                for j, state2 in enumerate(all_states[i:], i):
-                    if state1 == state2:
-                        continue
+            old_eval = previous_model.eval
+            new_eval = new_model.eval
+            imposition = semantics.imposition
+            is_true = z3.is_true
+            for state1, state2 in itertools.combinations(all_states, 2):
+                try:
+                    # Check if imposition relationship changed
+                    old_imposes = False
+                    new_imposes = False
+                    
+                    if state1 in old_states and state2 in old_states:
+                        # Imposition takes three arguments: (imposed_state, world, outcome_world)
+                        for outcome in all_states:
+                            if is_true(old_eval(imposition(state1, state2, outcome), model_completion=True)):
+                                old_imposes = True
+                                break
                         
-                    try:
-                        # Check if imposition relationship changed
-                        old_imposes = False
-                        new_imposes = False
+                    if state1 in new_states and state2 in new_states:
+                        for outcome in all_states:
+                            if is_true(new_eval(imposition(state1, state2, outcome), model_completion=True)):
+                                new_imposes = True
+                                break
                         
-                        if state1 in old_states and state2 in old_states:
-                            # Imposition takes three arguments: (imposed_state, world, outcome_world)
-                            for outcome in all_states:
-                                if bool(previous_model.eval(semantics.imposition(state1, state2, outcome), model_completion=True)):
-                                    old_imposes = True
-                                    break
-                            
-                        if state1 in new_states and state2 in new_states:
-                            for outcome in all_states:
-                                if bool(new_model.eval(semantics.imposition(state1, state2, outcome), model_completion=True)):
-                                    new_imposes = True
-                                    break
-                            
-                        if old_imposes != new_imposes:
-                            state_pair = f"{state1},{state2}"
-                            differences["imposition_relations"][state_pair] = {
-                                "old": old_imposes,
-                                "new": new_imposes
-                            }
-                    except Exception:
-                        pass
+                    if old_imposes != new_imposes:
+                        state_pair = f"{state1},{state2}"
+                        differences["imposition_relations"][state_pair] = {
+                            "old": old_imposes,
+                            "new": new_imposes
+                        }
+                except Exception:
+                    pass
                 
         return differences
     
+    def _compare_letter_relation(self, relation, atom, previous_model, new_model,
+                                 common_states, old_only_states, new_only_states):
+        """Find the states that gain or lose a relation to a sentence letter.
+        
+        A state only possible in one of the two models is treated as not
+        standing in the relation in the other model, so only that one model
+        needs to be evaluated for it. A state whose term cannot be evaluated
+        is skipped without affecting the others.
+        
+        Args:
+            relation: Semantic relation such as semantics.verify or semantics.falsify
+            atom: The sentence letter atom
+            previous_model: The previous Z3 model
+            new_model: The new Z3 model
+            common_states: States possible in both models
+            old_only_states: States possible only in the previous model
+            new_only_states: States possible only in the new model
+            
+        Returns:
+            tuple: (added, removed) lists of states
+        """
+        added = []
+        removed = []
+        old_eval = previous_model.eval
+        new_eval = new_model.eval
+        is_true = z3.is_true
+        
+        for state in common_states:
+            try:
+                term = relation(state, atom)
+                old_value = is_true(old_eval(term, model_completion=True))
+                new_value = is_true(new_eval(term, model_completion=True))
+            except z3.Z3Exception:
+                continue
+            if new_value and not old_value:
+                added.append(state)
+            elif old_value and not new_value:
+                removed.append(state)
+        
+        for state in old_only_states:
+            try:
+                if is_true(old_eval(relation(state, atom), model_completion=True)):
+                    removed.append(state)
+            except z3.Z3Exception:
+                continue
+        
+        for state in new_only_states:
+            try:
+                if is_true(new_eval(relation(state, atom), model_completion=True)):
+                    added.append(state)
+            except z3.Z3Exception:
+                continue
+        
+        return added, removed
+    
     def display_model_differences(self, model_structure, output=sys.stdout):
         """Format differences for display using imposition theory semantics.
         
@@ -231,132 +272,118 @@ class ImpositionModelIterator(BaseModelIterator):
             return
             
         differences = model_structure.model_differences
+        N = model_structure.semantics.N
+        b2s = bitvec_to_substates
+        
+        # Collect the report lines and write them to the stream in one call
+        lines = []
         
         # Use colors like logos theory
-        print("\n\033[33m=== DIFFERENCES FROM PREVIOUS MODEL ===\033[0m\n", file=output)
+        lines.append("\n\033[33m=== DIFFERENCES FROM PREVIOUS MODEL ===\033[0m\n")
         
         # Print world changes
         if 'worlds' in differences and (differences['worlds'].get('added') or differences['worlds'].get('removed')):
-            print("\033[34mWorld Changes:\033[0m", file=output)
+            lines.append("\033[34mWorld Changes:\033[0m")
             
             if differences['worlds'].get('added'):
                 for world in differences['worlds']['added']:
                     try:
-                        world_str = bitvec_to_substates(world, model_structure.semantics.N)
-                        print(f"  \033[32m+ {world_str} (now a world)\033[0m", file=output)
+                        world_str = b2s(world, N)
+                        lines.append(f"  \033[32m+ {world_str} (now a world)\033[0m")
                     except:
-                        print(f"  \033[32m+ {world} (now a world)\033[0m", file=output)
+                        lines.append(f"  \033[32m+ {world} (now a world)\033[0m")
             
             if differences['worlds'].get('removed'):
                 for world in differences['worlds']['removed']:
                     try:
-                        world_str = bitvec_to_substates(world, model_structure.semantics.N)
-                        print(f"  \033[31m- {world_str} (no longer a world)\033[0m", file=output)
+                        world_str = b2s(world, N)
+                        lines.append(f"  \033[31m- {world_str} (no longer a world)\033[0m")
                     except:
-                        print(f"  \033[31m- {world} (no longer a world)\033[0m", file=output)
+                        lines.append(f"  \033[31m- {world} (no longer a world)\033[0m")
         
         # Print possible state changes
         if 'possible_states' in differences and (differences['possible_states'].get('added') or differences['possible_states'].get('removed')):
-            print("\n\033[34mPossible State Changes:\033[0m", file=output)
+            lines.append("\n\033[34mPossible State Changes:\033[0m")
             
             if differences['possible_states'].get('added'):
                 for state in differences['possible_states']['added']:
                     try:
-                        state_str = bitvec_to_substates(state, model_structure.semantics.N)
-                        print(f"  \033[32m+ {state_str} (now possible)\033[0m", file=output)
+                        state_str = b2s(state, N)
+                        lines.append(f"  \033[32m+ {state_str} (now possible)\033[0m")
                     except:
-                        print(f"  \033[32m+ {state} (now possible)\033[0m", file=output)
+                        lines.append(f"  \033[32m+ {state} (now possible)\033[0m")
             
             if differences['possible_states'].get('removed'):
                 for state in differences['possible_states']['removed']:
                     try:
-                        state_str = bitvec_to_substates(state, model_structure.semantics.N)
-                        print(f"  \033[31m- {state_str} (now impossible)\033[0m", file=output)
+                        state_str = b2s(state, N)
+                        lines.append(f"  \033[31m- {state_str} (now impossible)\033[0m")
                     except:
-                        print(f"  \033[31m- {state} (now impossible)\033[0m", file=output)
+                        lines.append(f"  \033[31m- {state} (now impossible)\033[0m")
         
         # Print verification changes
         if 'verification' in differences and differences['verification']:
-            print("\n\033[34mVerification Changes:\033[0m", file=output)
+            lines.append("\n\033[34mVerification Changes:\033[0m")
             
             for letter_str, changes in differences['verification'].items():
                 # Extract just the letter name (A, B, C, etc.)
                 letter_name = letter_str.replace('Proposition_', '').replace('(', '').replace(')', '')
-                print(f"  Letter {letter_name}:", file=output)
+                lines.append(f"  Letter {letter_name}:")
                 
                 if changes.get('added'):
                     for state in changes['added']:
                         try:
-                            state_str = bitvec_to_substates(state, model_structure.semantics.N)
-                            print(f"    \033[32m+ {state_str} now verifies {letter_name}\033[0m", file=output)
+                            state_str = b2s(state, N)
+                            lines.append(f"    \033[32m+ {state_str} now verifies {letter_name}\033[0m")
                         except:
-                            print(f"    \033[32m+ {state} now verifies {letter_name}\033[0m", file=output)
+                            lines.append(f"    \033[32m+ {state} now verifies {letter_name}\033[0m")
                 
                 if changes.get('removed'):
                     for state in changes['removed']:
                         try:
-                            state_str = bitvec_to_substates(state, model_structure.semantics.N)
-                            print(f"    \033[31m- {state_str} no longer verifies {letter_name}\033[0m", file=output)
+                            state_str = b2s(state, N)
+                            lines.append(f"    \033[31m- {state_str} no longer verifies {letter_name}\033[0m")
                         except:
-                            print(f"    \033[31m- {state} no longer verifies {letter_name}\033[0m", file=output)
+                            lines.append(f"    \033[31m- {state} no longer verifies {letter_name}\033[0m")
         
         # Print falsification changes
         if 'falsification' in differences and differences['falsification']:
-            print("\n\033[34mFalsification Changes:\033[0m", file=output)
+            lines.append("\n\033[34mFalsification Changes:\033[0m")
             
             for letter_str, changes in differences['falsification'].items():
                 # Extract just the letter name (A, B, C, etc.)
                 letter_name = letter_str.replace('Proposition_', '').replace('(', '').replace(')', '')
-                print(f"  Letter {letter_name}:", file=output)
+                lines.append(f"  Letter {letter_name}:")
                 
                 if changes.get('added'):
                     for state in changes['added']:
                         try:
-                            state_str = bitvec_to_substates(state, model_structure.semantics.N)
-                            print(f"    \033[32m+ {state_str} now falsifies {letter_name}\033[0m", file=output)
+                            state_str = b2s(state, N)
+                            lines.append(f"    \033[32m+ {state_str} now falsifies {letter_name}\033[0m")
                         except:
-                            print(f"    \033[32m+ {state} now falsifies {letter_name}\033[0m", file=output)
+                            lines.append(f"    \033[32m+ {state} now falsifies {letter_name}\033[0m")
                 
                 if changes.get('removed'):
                     for state in changes['removed']:
                         try:
-                            state_str = bitvec_to_substates(state, model_structure.semantics.N)
-                            print(f"    \033[31m- {state_str} no longer falsifies {letter_name}\033[0m", file=output)
+                            state_str = b2s(state, N)
+                            lines.append(f"    \033[31m- {state_str} no longer falsifies {letter_name}\033[0m")
                         except:
-                            print(f"    \033[31m- {state} no longer falsifies {letter_name}\033[0m", file=output)
+                            lines.append(f"    \033[31m- {state} no longer falsifies {letter_name}\033[0m")
         
         # Print imposition relationship changes
-        if 'imposition_relations' in differences and differences['imposition_relations']:
-            print("\n\033[34mImposition Changes:\033[0m", file=output)
+        imposition_relations = differences.get('imposition_relations')
+        if imposition_relations:
+            lines.append("\n\033[34mImposition Changes:\033[0m")
             
-            for pair, change in differences['imposition_relations'].items():
-                # Try to parse the state pair
-                try:
-                    states = pair.split(',')
-                    if len(states) == 2:
-                        state1_bitvec = int(states[0])
-                        state2_bitvec = int(states[1])
-                        
-                        state1_str = bitvec_to_substates(state1_bitvec, model_structure.semantics.N)
-                        state2_str = bitvec_to_substates(state2_bitvec, model_structure.semantics.N)
-                        
-                        if change.get('new'):
-                            print(f"  \033[32m+ {state1_str} can now impose on {state2_str}\033[0m", file=output)
-                        else:
-                            print(f"  \033[31m- {state1_str} can no longer impose on {state2_str}\033[0m", file=output)
-                        continue
-                except:
-                    pass
-                
-                # Fall back to simple representation
-                if isinstance(change, dict) and 'old' in change and 'new' in change:
-                    if change['new']:
-                        print(f"  \033[32m+ {pair}: can now impose\033[0m", file=output)
-                    else:
-                        print(f"  \033[31m- {pair}: can no longer impose\033[0m", file=output)
+            for pair, change in imposition_relations.items():
+                sign, text = describe_imposition_change(pair, change, N)
+                if sign is None:
+                    lines.append(f"  {text}")
                 else:
-                    print(f"  {pair}: changed", file=output)
-
+                    lines.append(f"  {_CHANGE_COLORS[sign]}{sign} {text}\033[0m")
+        
+        output.write("\n".join(lines) + "\n")
     
     def _create_difference_constraint(self, previous_models):
         """Create constraints requiring difference from previous models.
@@ -2,6 +2,7 @@
 ### DEFINE THE IMPORTS ###
 ##########################
 
+import functools
 import z3
 import sys
 import time
@@ -555,112 +556,142 @@ class ImpositionModelStructure(LogosModelStructure):
             return
         
         diffs = self.model_differences
+        N = self.N
+        write = output.write
         
         # Print header with colors
-        print(f"\n{self.COLORS['world']}=== DIFFERENCES FROM PREVIOUS MODEL ==={self.RESET}\n", file=output)
+        write(f"\n{self.COLORS['world']}=== DIFFERENCES FROM PREVIOUS MODEL ==={self.RESET}\n\n")
         
         # World changes - use 'world_changes' key from generic calculator
         worlds = diffs.get('world_changes', {})
         if worlds.get('added') or worlds.get('removed'):
-            print(f"{self.COLORS['world']}World Changes:{self.RESET}", file=output)
+            write(f"{self.COLORS['world']}World Changes:{self.RESET}\n")
             for world in worlds.get('added', []):
-                world_str = bitvec_to_substates(world, self.N)
-                print(f"  {self.COLORS['possible']}+ {world_str} (now a world){self.RESET}", file=output)
+                world_str = bitvec_to_substates(world, N)
+                write(f"  {self.COLORS['possible']}+ {world_str} (now a world){self.RESET}\n")
             for world in worlds.get('removed', []):
-                world_str = bitvec_to_substates(world, self.N)
-                print(f"  {self.COLORS['impossible']}- {world_str} (no longer a world){self.RESET}", file=output)
-            print(file=output)
+                world_str = bitvec_to_substates(world, N)
+                write(f"  {self.COLORS['impossible']}- {world_str} (no longer a world){self.RESET}\n")
+            write("\n")
         
         # Possible state changes
         possible = diffs.get('possible_changes', {})
         if possible.get('added') or possible.get('removed'):
-            print(f"{self.COLORS['world']}Possible State Changes:{self.RESET}", file=output)
+            write(f"{self.COLORS['world']}Possible State Changes:{self.RESET}\n")
             for state in possible.get('added', []):
-                state_str = bitvec_to_substates(state, self.N)
-                print(f"  {self.COLORS['possible']}+ {state_str} (now possible){self.RESET}", file=output)
+                state_str = bitvec_to_substates(state, N)
+                write(f"  {self.COLORS['possible']}+ {state_str} (now possible){self.RESET}\n")
             for state in possible.get('removed', []):
-                state_str = bitvec_to_substates(state, self.N)
-                print(f"  {self.COLORS['impossible']}- {state_str} (now impossible){self.RESET}", file=output)
-            print(file=output)
+                state_str = bitvec_to_substates(state, N)
+                write(f"  {self.COLORS['impossible']}- {state_str} (now impossible){self.RESET}\n")
+            write("\n")
         
         # Verification changes (theory-specific)
         verification = diffs.get('verification', {})
         if verification:
-            print(f"{self.COLORS['world']}Verification Changes:{self.RESET}", file=output)
+            write(f"{self.COLORS['world']}Verification Changes:{self.RESET}\n")
             for letter_str, changes in verification.items():
                 letter_name = letter_str.replace('Proposition_', '').replace('(', '').replace(')', '')
-                print(f"  Letter {letter_name}:", file=output)
+                write(f"  Letter {letter_name}:\n")
                 
                 if changes.get('added'):
                     for state in changes['added']:
                         try:
-                            state_str = bitvec_to_substates(state, self.N)
-                            print(f"    {self.COLORS['possible']}+ {state_str} now verifies {letter_name}{self.RESET}", file=output)
+                            state_str = bitvec_to_substates(state, N)
+                            write(f"    {self.COLORS['possible']}+ {state_str} now verifies {letter_name}{self.RESET}\n")
                         except:
-                            print(f"    {self.COLORS['possible']}+ {state} now verifies {letter_name}{self.RESET}", file=output)
+                            write(f"    {self.COLORS['possible']}+ {state} now verifies {letter_name}{self.RESET}\n")
                 
                 if changes.get('removed'):
                     for state in changes['removed']:
                         try:
-                            state_str = bitvec_to_substates(state, self.N)
-                            print(f"    {self.COLORS['impossible']}- {state_str} no longer verifies {letter_name}{self.RESET}", file=output)
+                            state_str = bitvec_to_substates(state, N)
+                            write(f"    {self.COLORS['impossible']}- {state_str} no longer verifies {letter_name}{self.RESET}\n")
                         except:
-                            print(f"    {self.COLORS['impossible']}- {state} no longer verifies {letter_name}{self.RESET}", file=output)
-            print(file=output)
+                            write(f"    {self.COLORS['impossible']}- {state} no longer verifies {letter_name}{self.RESET}\n")
+            write("\n")
         
         # Falsification changes (theory-specific)
         falsification = diffs.get('falsification', {})
         if falsification:
-            print(f"{self.COLORS['world']}Falsification Changes:{self.RESET}", file=output)
+            write(f"{self.COLORS['world']}Falsification Changes:{self.RESET}\n")
             for letter_str, changes in falsification.items():
                 letter_name = letter_str.replace('Proposition_', '').replace('(', '').replace(')', '')
-                print(f"  Letter {letter_name}:", file=output)
+                write(f"  Letter {letter_name}:\n")
                 
                 if changes.get('added'):
                     for state in changes['added']:
                         try:
-                            state_str = bitvec_to_substates(state, self.N)
-                            print(f"    {self.COLORS['possible']}+ {state_str} now falsifies {letter_name}{self.RESET}", file=output)
+                            state_str = bitvec_to_substates(state, N)
+                            write(f"    {self.COLORS['possible']}+ {state_str} now falsifies {letter_name}{self.RESET}\n")
                         except:
-                            print(f"    {self.COLORS['possible']}+ {state} now falsifies {letter_name}{self.RESET}", file=output)
+                            write(f"    {self.COLORS['possible']}+ {state} now falsifies {letter_name}{self.RESET}\n")
                 
                 if changes.get('removed'):
                     for state in changes['removed']:
                         try:
-                            state_str = bitvec_to_substates(state, self.N)
-                            print(f"    {self.COLORS['impossible']}- {state_str} no longer falsifies {letter_name}{self.RESET}", file=output)
+                            state_str = bitvec_to_substates(state, N)
+                            write(f"    {self.COLORS['impossible']}- {state_str} no longer falsifies {letter_name}{self.RESET}\n")
                         except:
-                            print(f"    {self.COLORS['impossible']}- {state} no longer falsifies {letter_name}{self.RESET}", file=output)
-            print(file=output)
+                            write(f"    {self.COLORS['impossible']}- {state} no longer falsifies {letter_name}{self.RESET}\n")
+            write("\n")
         
         # Imposition relation changes (theory-specific with improved formatting)
         imp_diffs = diffs.get('imposition_relations', {})
         if imp_diffs:
-            print(f"{self.COLORS['world']}Imposition Changes:{self.RESET}", file=output)
+            write(f"{self.COLORS['world']}Imposition Changes:{self.RESET}\n")
+            
+            # Bind the lookups used for every relation below
+            added = self.COLORS['possible']
+            removed = self.COLORS['impossible']
+            reset = self.RESET
             for relation, change in imp_diffs.items():
-                # Try to parse the state pair for better formatting
-                try:
-                    states = relation.split(',')
-                    if len(states) == 2:
-                        state1_bitvec = int(states[0])
-                        state2_bitvec = int(states[1])
-                        
-                        state1_str = bitvec_to_substates(state1_bitvec, self.N)
-                        state2_str = bitvec_to_substates(state2_bitvec, self.N)
-                        
-                        if change.get('new'):
-                            print(f"  {self.COLORS['possible']}+ {state1_str} can now impose on {state2_str}{self.RESET}", file=output)
-                        else:
-                            print(f"  {self.COLORS['impossible']}- {state1_str} can no longer impose on {state2_str}{self.RESET}", file=output)
-                        continue
-                except:
-                    pass
-                
-                # Fall back to simple representation if parsing fails
-                if change.get('new'):
-                    print(f"  {self.COLORS['possible']}+ {relation}: can now impose{self.RESET}", file=output)
+                sign, text = describe_imposition_change(relation, change, N)
+                if sign is None:
+                    write(f"  {text}\n")
                 else:
-                    print(f"  {self.COLORS['impossible']}- {relation}: can no longer impose{self.RESET}", file=output)
-            print(file=output)
+                    color = added if sign == "+" else removed
+                    write(f"  {color}{sign} {text}{reset}\n")
+            write("\n")
         
         return True
+
+
+# Imposition pair keys are parsed back into integers, so the label of each
+# state can be cached by value and N across all pairs, models and printers
+_state_label = functools.lru_cache(maxsize=4096)(bitvec_to_substates)
+
+
+def describe_imposition_change(pair, change, N):
+    """Describe one change in the imposition relation for a difference report.
+    
+    Both ImpositionModelStructure.print_model_differences and the iterator's
+    display_model_differences format changes through this function, so pair
+    keys are parsed, labelled and given a fallback the same way in each.
+    
+    Args:
+        pair: Key naming the two states as "state1,state2"
+        change: Dictionary with the old and new values of the relation
+        N: Number of atomic states
+        
+    Returns:
+        tuple: (sign, text) where sign is "+" for a gained imposition, "-" for
+            a lost one, or None if an unparsed key records no new value, and
+            text is the description to follow it
+    """
+    new_value = change.get('new') if isinstance(change, dict) else None
+    try:
+        state1, state2 = map(int, pair.split(','))
+        state1_str = _state_label(state1, N)
+        state2_str = _state_label(state2, N)
+    except (ValueError, z3.Z3Exception):
+        # Fall back to simple representation if parsing fails
+        if new_value is None:
+            return None, f"{pair}: changed"
+        if new_value:
+            return "+", f"{pair}: can now impose"
+        return "-", f"{pair}: can no longer impose"
+    
+    if new_value:
+        return "+", f"{state1_str} can now impose on {state2_str}"
+    return "-", f"{state1_str} can no longer impose on {state2_str}"
@@ -11,6 +11,7 @@ import sys
 import logging
 
 from model_checker.iterate.core import BaseModelIterator
+from model_checker.iterate.models import state_set
 from model_checker.utils import bitvec_to_substates, pretty_set_print
 
 # Configure logging
@@ -33,6 +34,19 @@ class LogosModelIterator(BaseModelIterator):
     - Support for modal, constitutive, and counterfactual operators
     """
     
+    def __init__(self, build_example):
+        """Initialize the iterator and record whether parthood can vary.
+        
+        Args:
+            build_example: BuildExample instance with a valid model
+        """
+        super().__init__(build_example)
+        
+        # Parthood is defined the same way for every model of the example,
+        # so whether it can differ between models is settled once here
+        semantics = self.build_example.model_constraints.semantics
+        self._varying_parthood = self._parthood_varies(semantics, semantics.all_states)
+    
     def _calculate_differences(self, new_structure, previous_structure):
         """Calculate differences between two logos theory model structures.
         
@@ -97,8 +111,8 @@ class LogosModelIterator(BaseModelIterator):
         }
         
         # Compare worlds and possible states
-        old_worlds = set(getattr(previous_structure, "z3_world_states", []))
-        new_worlds = set(getattr(new_structure, "z3_world_states", []))
+        old_worlds = state_set(previous_structure, "z3_world_states")
+        new_worlds = state_set(new_structure, "z3_world_states")
         
         # Find added/removed worlds
         for world in new_worlds:
@@ -110,8 +124,8 @@ class LogosModelIterator(BaseModelIterator):
                 differences["worlds"]["removed"].append(world)
         
         # Compare possible states
-        old_states = set(getattr(previous_structure, "z3_possible_states", []))
-        new_states = set(getattr(new_structure, "z3_possible_states", []))
+        old_states = state_set(previous_structure, "z3_possible_states")
+        new_states = state_set(new_structure, "z3_possible_states")
         
         # Find added/removed possible states
         for state in new_states:
@@ -122,69 +136,55 @@ class LogosModelIterator(BaseModelIterator):
             if state not in new_states:
                 differences["possible_states"]["removed"].append(state)
         
+        # Bind the lookups used in the evaluation loops below
+        old_eval = previous_model.eval
+        new_eval = new_model.eval
+        is_true = z3.is_true
+        
         # Compare sentence letter interpretations using verify/falsify
         for letter in new_structure.sentence_letters:
-            try:
-                # Get the Z3 atom for this sentence letter
-                if hasattr(letter, 'sentence_letter') and letter.sentence_letter is not None:
-                    atom = letter.sentence_letter
-                else:
-                    # Skip if we can't get the atom
-                    continue
-                
-                # Check verification changes
-                verify_diffs = {}
-                for state in new_structure.all_states:
-                    old_verify = previous_model.eval(semantics.verify(state, atom), model_completion=True)
-                    new_verify = new_model.eval(semantics.verify(state, atom), model_completion=True)
-                    
-                    if bool(old_verify) != bool(new_verify):
-                        state_str = bitvec_to_substates(state, new_structure.N)
-                        verify_diffs[state_str] = {
-                            "old": bool(old_verify),
-                            "new": bool(new_verify)
-                        }
-                
-                if verify_diffs:
-                    differences["verify"][str(letter)] = verify_diffs
-                
-                # Check falsification changes
-                falsify_diffs = {}
-                for state in new_structure.all_states:
-                    old_falsify = previous_model.eval(semantics.falsify(state, atom), model_completion=True)
-                    new_falsify = new_model.eval(semantics.falsify(state, atom), model_completion=True)
-                    
-                    if bool(old_falsify) != bool(new_falsify):
-                        state_str = bitvec_to_substates(state, new_structure.N)
-                        falsify_diffs[state_str] = {
-                            "old": bool(old_falsify),
-                            "new": bool(new_falsify)
-                        }
-                
-                if falsify_diffs:
-                    differences["falsify"][str(letter)] = falsify_diffs
-                    
-            except z3.Z3Exception:
-                pass
-        
-        # Compare parthood relations
-        semantics = new_structure.semantics
+            # Get the Z3 atom for this sentence letter
+            if hasattr(letter, 'sentence_letter') and letter.sentence_letter is not None:
+                atom = letter.sentence_letter
+            else:
+                # Skip if we can't get the atom
+                continue
+            
+            # Record verify changes before falsify is evaluated
+            verify_diffs = self._letter_relation_differences(
+                semantics.verify, atom, new_structure, old_eval, new_eval
+            )
+            if verify_diffs:
+                differences["verify"][str(letter)] = verify_diffs
+            
+            # Not every semantics built on this iterator has a falsify relation
+            if not hasattr(semantics, 'falsify'):
+                continue
+            falsify_diffs = self._letter_relation_differences(
+                semantics.falsify, atom, new_structure, old_eval, new_eval
+            )
+            if falsify_diffs:
+                differences["falsify"][str(letter)] = falsify_diffs
+        
+        # Compare parthood relations, unless parthood is the same in every model
         parthood_diffs = {}
-        for s1 in new_structure.all_states:
-            for s2 in new_structure.all_states:
+        parthood_states = new_structure.all_states if self._varying_parthood else []
+        for s1 in parthood_states:
+            for s2 in parthood_states:
                 if s1 == s2:
                     continue
                     
                 try:
-                    old_part = previous_model.eval(semantics.is_part_of(s1, s2), model_completion=True)
-                    new_part = new_model.eval(semantics.is_part_of(s1, s2), model_completion=True)
+                    part_term = semantics.is_part_of(s1, s2)
+                    old_part = is_true(old_eval(part_term, model_completion=True))
+                    new_part = is_true(new_eval(part_term, model_completion=True))
                     
-                    if bool(old_part) != bool(new_part):
+                    if old_part != new_part:
                         s1_str = bitvec_to_substates(s1, new_structure.N)
                         s2_str = bitvec_to_substates(s2, new_structure.N)
                         parthood_diffs[f"{s1_str} ⊑ {s2_str}"] = {
-                            "old": bool(old_part),
-                            "new": bool(new_part)
+                            "old": old_part,
+                            "new": new_part
                         }
                 except z3.Z3Exception:
                     pass
@@ -194,6 +194,79 @@ class LogosModelIterator(BaseModelIterator):
         
         return differences
     
+    def _letter_relation_differences(self, relation, atom, new_structure, old_eval, new_eval):
+        """Find the states whose relation to a sentence letter changed between models.
+        
+        A state whose term cannot be evaluated is skipped without affecting
+        the others.
+        
+        Args:
+            relation: The semantic relation, such as verify or falsify
+            atom: The Z3 atom of the sentence letter
+            new_structure: The new model structure
+            old_eval: Evaluation function of the previous Z3 model
+            new_eval: Evaluation function of the new Z3 model
+            
+        Returns:
+            dict: Mapping from state strings to their old and new values
+        """
+        is_true = z3.is_true
+        diffs = {}
+        for state in new_structure.all_states:
+            # Build each term once and evaluate it in both models
+            try:
+                term = relation(state, atom)
+                old_value = is_true(old_eval(term, model_completion=True))
+                new_value = is_true(new_eval(term, model_completion=True))
+            except z3.Z3Exception:
+                continue
+            
+            if old_value != new_value:
+                state_str = bitvec_to_substates(state, new_structure.N)
+                diffs[state_str] = {
+                    "old": old_value,
+                    "new": new_value
+                }
+        return diffs
+    
+    def _parthood_varies(self, semantics, states):
+        """Check whether parthood between the given states can differ between models.
+        
+        The default mereology fuses states by bitwise OR, so parthood between two
+        bit vector values is a closed term with the same value in every model.
+        Rather than sampling pairs, is_part_of is applied to two symbolic states
+        and the resulting term is searched for model symbols. If it mentions
+        nothing but those two states, every pair of fixed states yields a
+        closed term, so parthood is fixed for all pairs at once.
+        
+        Args:
+            semantics: The semantics providing is_part_of
+            states: The bit vector states to compare
+            
+        Returns:
+            bool: False if parthood between the states is fixed
+        """
+        if len(states) < 2:
+            return False
+        part, whole = z3.Consts("part whole", states[0].sort())
+        arguments = {part.decl(), whole.decl()}
+        
+        # Walk the term once, visiting each shared subterm a single time
+        pending = [semantics.is_part_of(part, whole)]
+        visited = set()
+        while pending:
+            term = pending.pop()
+            if term.get_id() in visited:
+                continue
+            visited.add(term.get_id())
+            if not z3.is_app(term):
+                continue
+            decl = term.decl()
+            if decl.kind() == z3.Z3_OP_UNINTERPRETED and decl not in arguments:
+                return True
+            pending.extend(term.children())
+        return False
+    
     def _create_difference_constraint(self, previous_models):
         """Create constraints requiring difference from previous models.
         
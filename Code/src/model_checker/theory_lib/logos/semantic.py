@@ -938,66 +938,72 @@ class LogosModelStructure(ModelDefaults):
         else:
             GREEN = RED = YELLOW = BLUE = RESET = ""
         
-        print(f"\n{YELLOW}=== DIFFERENCES FROM PREVIOUS MODEL ==={RESET}\n", file=output)
+        # Collect the report lines and write them to the stream in one call
+        lines = []
+        
+        lines.append(f"\n{YELLOW}=== DIFFERENCES FROM PREVIOUS MODEL ==={RESET}\n")
         
         # Print world changes
         if diffs.get('world_changes', {}).get('added') or diffs.get('world_changes', {}).get('removed'):
-            print(f"{BLUE}World Changes:{RESET}", file=output)
+            lines.append(f"{BLUE}World Changes:{RESET}")
             for world in diffs.get('world_changes', {}).get('added', []):
                 world_str = bitvec_to_substates(world, self.N)
-                print(f"  {GREEN}+ {world_str} (now a world){RESET}", file=output)
+                lines.append(f"  {GREEN}+ {world_str} (now a world){RESET}")
             for world in diffs.get('world_changes', {}).get('removed', []):
                 world_str = bitvec_to_substates(world, self.N)
-                print(f"  {RED}- {world_str} (no longer a world){RESET}", file=output)
-            print("", file=output)
+                lines.append(f"  {RED}- {world_str} (no longer a world){RESET}")
+            lines.append("")
         
         # Print possible state changes
         if diffs.get('possible_changes', {}).get('added') or diffs.get('possible_changes', {}).get('removed'):
-            print(f"{BLUE}Possible State Changes:{RESET}", file=output)
+            lines.append(f"{BLUE}Possible State Changes:{RESET}")
             for state in diffs.get('possible_changes', {}).get('added', []):
                 state_str = bitvec_to_substates(state, self.N)
-                print(f"  {GREEN}+ {state_str} (now possible){RESET}", file=output)
+                lines.append(f"  {GREEN}+ {state_str} (now possible){RESET}")
             for state in diffs.get('possible_changes', {}).get('removed', []):
                 state_str = bitvec_to_substates(state, self.N)
-                print(f"  {RED}- {state_str} (now impossible){RESET}", file=output)
-            print("", file=output)
+                lines.append(f"  {RED}- {state_str} (now impossible){RESET}")
+            lines.append("")
         
         # Print atomic changes (verify/falsify)
         if diffs.get('atomic_changes'):
             atomic = diffs.get('atomic_changes', {})
             # Print verification changes
             if atomic.get('verify'):
-                print(f"{BLUE}Verification Changes:{RESET}", file=output)
+                lines.append(f"{BLUE}Verification Changes:{RESET}")
                 for letter, state_changes in atomic['verify'].items():
-                    print(f"  Letter {letter}:", file=output)
+                    lines.append(f"  Letter {letter}:")
                     for state_str, change in state_changes.items():
                         if change['new']:
-                            print(f"    {GREEN}+ {state_str} now verifies {letter}{RESET}", file=output)
+                            lines.append(f"    {GREEN}+ {state_str} now verifies {letter}{RESET}")
                         else:
-                            print(f"    {RED}- {state_str} no longer verifies {letter}{RESET}", file=output)
-                print("", file=output)
+                            lines.append(f"    {RED}- {state_str} no longer verifies {letter}{RESET}")
+                lines.append("")
             
             # Print falsification changes
             if atomic.get('falsify'):
-                print(f"{BLUE}Falsification Changes:{RESET}", file=output)
+                lines.append(f"{BLUE}Falsification Changes:{RESET}")
                 for letter, state_changes in atomic['falsify'].items():
-                    print(f"  Letter {letter}:", file=output)
+                    lines.append(f"  Letter {letter}:")
                     for state_str, change in state_changes.items():
                         if change['new']:
-                            print(f"    {GREEN}+ {state_str} now falsifies {letter}{RESET}", file=output)
+                            lines.append(f"    {GREEN}+ {state_str} now falsifies {letter}{RESET}")
                         else:
-                            print(f"    {RED}- {state_str} no longer falsifies {letter}{RESET}", file=output)
-                print("", file=output)
+                            lines.append(f"    {RED}- {state_str} no longer falsifies {letter}{RESET}")
+                lines.append("")
         
         # Print parthood changes
-        if diffs.get('parthood'):
-            print(f"{BLUE}Part-of Relation Changes:{RESET}", file=output)
-            for relation, change in diffs['parthood'].items():
+        parthood = diffs.get('parthood')
+        if parthood:
+            lines.append(f"{BLUE}Part-of Relation Changes:{RESET}")
+            for relation, change in parthood.items():
                 if change['new']:
-                    print(f"  {GREEN}+ {relation}{RESET}", file=output)
+                    lines.append(f"  {GREEN}+ {relation}{RESET}")
                 else:
-                    print(f"  {RED}- {relation}{RESET}", file=output)
-            print("", file=output)
+                    lines.append(f"  {RED}- {relation}{RESET}")
+            lines.append("")
+        
+        output.write("\n".join(lines) + "\n")
     
     def print_evaluation(self, output=sys.__stdout__):
         """Print the evaluation world and evaluate all sentence letters at that world."""
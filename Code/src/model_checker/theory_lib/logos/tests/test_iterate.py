@@ -1,6 +1,7 @@
 """Simple tests for logos theory model iteration."""
 
 import pytest
+import z3
 from model_checker.theory_lib.logos import (
     LogosSemantics, LogosProposition, LogosModelStructure, 
     LogosOperatorRegistry, iterate_example, LogosModelIterator
@@ -198,4 +199,43 @@ class TestLogosIterator:
         if len(models) > 1:
             second_model = models[1]
             assert hasattr(second_model, 'model_differences')
-            assert second_model.model_differences is not None
\ No newline at end of file
+            assert second_model.model_differences is not None
+    
+    def test_parthood_varies(self):
+        """Test that bitwise parthood is recognised as fixed across models."""
+        iterator = LogosModelIterator.__new__(LogosModelIterator)
+        states = [z3.BitVecVal(i, 2) for i in range(4)]
+        
+        bitwise = Mock()
+        bitwise.is_part_of = lambda s, t: (s | t) == t
+        assert not iterator._parthood_varies(bitwise, states)
+        
+        # Parthood given by an uninterpreted relation depends on the model
+        part = z3.Function('part', z3.BitVecSort(2), z3.BitVecSort(2), z3.BoolSort())
+        interpreted = Mock()
+        interpreted.is_part_of = part
+        assert iterator._parthood_varies(interpreted, states)
+        
+        # A relation that is fixed for the first pair but not for others still varies
+        partly_fixed = Mock()
+        partly_fixed.is_part_of = lambda s, t: z3.If(
+            z3.And(s == states[0], t == states[1]), z3.BoolVal(True), part(s, t)
+        )
+        assert iterator._parthood_varies(partly_fixed, states)
+    
+    def test_letter_relation_differences_skip_state(self):
+        """Test that one unevaluable state does not drop the letter's other changes."""
+        iterator = LogosModelIterator.__new__(LogosModelIterator)
+        
+        def relation(state, atom):
+            if state == 1:
+                raise z3.Z3Exception("cannot evaluate")
+            return z3.BoolVal(state == 2)
+        
+        new_structure = SimpleNamespace(all_states=[0, 1, 2, 3], N=2)
+        old_eval = lambda term, model_completion=False: z3.BoolVal(False)
+        new_eval = lambda term, model_completion=False: term
+        diffs = iterator._letter_relation_differences(
+            relation, "A", new_structure, old_eval, new_eval
+        )
+        assert diffs == {"b": {"old": False, "new": True}}